@@ -8,11 +8,26 @@ import argparse
 import os
 import sys
 
-def max(a, b):
-    return a if a > b else b
 
-def min(a, b):
-    return a if a < b else b
+def compute_thread_counts(cpu_count, file_count):
+    """
+    Return (flatten_threads, readers_per_flattener, reader_threads, total_threads)
+    for merging file_count files on cpu_count CPUs
+    """
+    flatten_threads = min(cpu_count - 2, file_count)
+
+    remaining_threads = cpu_count - flatten_threads
+    # This is the ratio of reader threads to flatten threads
+    reader_threads = max(1, math.floor(remaining_threads / flatten_threads))
+
+    readers_per_flattener = math.ceil(file_count / flatten_threads)
+
+    # compute it back out to see the counts after rounding/truncation 
+    merge_threads = ((file_count + readers_per_flattener) / readers_per_flattener)
+    total = (merge_threads * reader_threads) + merge_threads
+
+    return flatten_threads, readers_per_flattener, reader_threads, total
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -34,6 +49,12 @@ def main():
         action='store_true',
         help='Output only the readers_per_flattener count'
     )
+    parser.add_argument(
+        '--shell',
+        action='store_true',
+        help='Output "reader_threads readers_per_flattener" on one line and '
+             'write the full summary to stderr'
+    )
     parser.add_argument(
         '--cpu-count',
         type=int,
@@ -61,30 +82,26 @@ def main():
     # merge count is the number of threads for the merge steps
     file_count = args.count
 
-    flatten_threads = min(cpu_count - 2, file_count)
+    flatten_threads, readers_per_flattener, reader_threads, total = \
+        compute_thread_counts(cpu_count, file_count)
 
-    remaining_threads = cpu_count - flatten_threads
-    # This is the ratio of reader threads to flatten threads
-    reader_threads = max(1, math.floor(remaining_threads / flatten_threads))
-
-    readers_per_flattener = math.ceil(file_count / flatten_threads)
-
-    # compute it back out to see the counts after rounding/truncation 
-    merge_threads = ((file_count + readers_per_flattener) / readers_per_flattener)
-    total = (merge_threads * reader_threads) + merge_threads
+    # Default: output all values. --shell logs them on stderr instead, so that
+    # stdout carries only the values the caller parses
+    if args.shell or not (args.reader_threads or args.readers_per_flattener):
+        out = sys.stderr if args.shell else sys.stdout
+        print(f"cpu_count: {cpu_count}", file=out)
+        print(f"flatten_threads: {flatten_threads}", file=out)
+        print(f"readers_per_flattener: {readers_per_flattener}", file=out)
+        print(f"reader_threads: {reader_threads}", file=out)
+        print(f"total_threads: {total}", file=out)
 
     # If specific flags are set, output only that value for easy parsing
-    if args.reader_threads:
+    if args.shell:
+        print(f"{reader_threads} {readers_per_flattener}")
+    elif args.reader_threads:
         print(reader_threads)
     elif args.readers_per_flattener:
         print(readers_per_flattener)
-    else:
-        # Default: output all values
-        print(f"cpu_count: {cpu_count}")
-        print(f"flatten_threads: {flatten_threads}")
-        print(f"readers_per_flattener: {readers_per_flattener}")
-        print(f"reader_threads: {reader_threads}")
-        print(f"total_threads: {total}")
 
 
 if __name__ == '__main__':